@@ -9,115 +9,202 @@ This script:
 - Adds new notices to penalty_notices.json (or updates existing ones)
 """
 
-import json
+import os
 import re
 import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urljoin
 
+import lxml.html
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from lxml.etree import ParserError, XPath
+from lxml.html import HtmlElement
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Constants
 WEEKLY_URL = "https://www.foodauthority.nsw.gov.au/offences/penalty-notices/week"
 BASE_URL = "https://www.foodauthority.nsw.gov.au"
 RATE_LIMIT_DELAY = 1.2
+MAX_CONCURRENT_REQUESTS = 8
+NOTICE_LINK_RE = re.compile(r'/offences/penalty-notices/(\d+)')
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Fields that decide whether a re-parsed entry differs from the stored one
+COMPARE_FIELDS = (
+    "penalty_notice_number", "name", "council", "date_of_offence",
+    "offence_code", "offence_description", "offence_nature",
+    "penalty_amount", "party_served", "date_issued", "issued_by",
+)
+COMPARE_ADDRESS_FIELDS = ("street", "city", "postal_code", "full")
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces request start times at least `interval` seconds apart."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller may start its request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+rate_limiter = RateLimiter(RATE_LIMIT_DELAY)
+
+# A single session reuses keep-alive connections to the Food Authority host
+SESSION = requests.Session()
+SESSION.headers.update(HTTP_HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains `name`."""
+    # The cheap contains(@class, ...) test rejects most elements before the
+    # exact whitespace-delimited class match runs
+    return (
+        f"@class and contains(@class, '{name}') and "
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+    )
+
+
+# Every Drupal field wrapper carries a class like 'field--name-field-penalty-notice-number'.
+# The page is indexed by field name in one pass, and values are then looked up
+# inside the matching wrapper rather than by a full-document XPath per field.
+FIELD_CLASS_PREFIX = "field--name-field-"
+FIELD_WRAPPERS = XPath(f"//*[@class and contains(@class, '{FIELD_CLASS_PREFIX}')]")
+FIELD_ITEM = XPath(f".//*[{has_class('field__item')}]")
+FIELD_ITEM_TIME = XPath(f".//*[{has_class('field__item')}]//time")
+
+# (result key, Drupal field name) pairs
+PENALTY_NOTICE_TEXT_FIELDS = tuple(
+    (key, f"penalty-notice-{name}")
+    for key, name in (
+        ("penalty_notice_number", "number"),
+        ("trade_name", "trade"),
+        ("party_served_surname", "surname"),
+        ("street", "street"),
+        ("city", "city"),
+        ("postal_code", "zip"),
+        ("council", "council"),
+        ("offence_code", "code"),
+        ("offence_description", "description"),
+        ("offence_nature", "nature"),
+        ("penalty_amount", "amount"),
+        ("issued_by", "issued-by"),
+    )
+)
+PENALTY_NOTICE_DATE_FIELDS = (
+    ("date_of_offence", "penalty-notice-date"),
+    ("date_issued", "penalty-notice-issued-date"),
+)
+
+# One parser for every page. The site serves UTF-8, so hand lxml the raw
+# response bytes instead of having requests guess the encoding and decode
+# them first. Element ids are never looked up, so skip building the id table.
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8", collect_ids=False)
 
 
 # Parsing functions (reused from 1_parse_scrape.py logic)
-def extract_text(soup: BeautifulSoup, selector: str) -> Optional[str]:
-    """Extract text from a CSS selector, returning None if not found."""
-    element = soup.select_one(selector)
-    if element:
-        return element.get_text(strip=True)
+def parse_html(content: bytes) -> Optional[HtmlElement]:
+    """Parse raw HTML bytes with lxml, returning None for empty documents."""
+    try:
+        return lxml.html.fromstring(content, parser=HTML_PARSER)
+    except ParserError:
+        return None
+
+
+def stripped_strings(element: HtmlElement) -> Iterator[str]:
+    """Yield the non-empty, whitespace-stripped text fragments of an element."""
+    for text in element.itertext():
+        text = text.strip()
+        if text:
+            yield text
+
+
+def index_field_wrappers(tree: HtmlElement) -> Dict[str, List[HtmlElement]]:
+    """Map each Drupal field name on the page, e.g. 'penalty-notice-number', to its wrapper elements."""
+    wrappers = {}
+    for wrapper in FIELD_WRAPPERS(tree):
+        for class_name in wrapper.get("class").split():
+            if class_name.startswith(FIELD_CLASS_PREFIX):
+                wrappers.setdefault(class_name[len(FIELD_CLASS_PREFIX):], []).append(wrapper)
+    return wrappers
+
+
+def field_item(
+    wrappers: Dict[str, List[HtmlElement]], field_name: str, selector: XPath = FIELD_ITEM
+) -> Optional[HtmlElement]:
+    """Return the first element matching `selector` inside the named field, or None."""
+    for wrapper in wrappers.get(field_name, ()):
+        elements = selector(wrapper)
+        if elements:
+            return elements[0]
     return None
 
 
-def extract_datetime(soup: BeautifulSoup, selector: str) -> Optional[str]:
-    """Extract datetime attribute from a time element."""
-    element = soup.select_one(selector)
-    if element and element.name == 'time':
+def extract_text(wrappers: Dict[str, List[HtmlElement]], field_name: str) -> Optional[str]:
+    """Extract the text of a field, returning None if not found."""
+    element = field_item(wrappers, field_name)
+    if element is not None:
+        return "".join(stripped_strings(element))
+    return None
+
+
+def extract_datetime(wrappers: Dict[str, List[HtmlElement]], field_name: str) -> Optional[str]:
+    """Extract the datetime attribute of the time element in a field."""
+    element = field_item(wrappers, field_name, FIELD_ITEM_TIME)
+    if element is not None:
         return element.get('datetime')
     return None
 
 
-def parse_penalty_notice_from_html(html_content: str, url: str = "") -> Optional[Dict]:
+def parse_penalty_notice_from_html(html_content: bytes, url: str = "") -> Optional[Dict]:
     """Parse a single penalty notice HTML content."""
-    soup = BeautifulSoup(html_content, 'lxml')
+    tree = parse_html(html_content)
+    if tree is None:
+        print(f"Warning: Could not find penalty notice number in {url}")
+        return None
     
-    penalty_notice_number = extract_text(
-        soup, '.field--name-field-penalty-notice-number .field__item'
-    )
+    wrappers = index_field_wrappers(tree)
+    fields = {key: extract_text(wrappers, field_name) for key, field_name in PENALTY_NOTICE_TEXT_FIELDS}
     
+    penalty_notice_number = fields["penalty_notice_number"]
     if not penalty_notice_number:
         print(f"Warning: Could not find penalty notice number in {url}")
         return None
     
-    trade_name = extract_text(
-        soup, '.field--name-field-penalty-notice-trade .field__item'
-    )
-    
-    party_served_trade = extract_text(
-        soup, '.field--name-field-penalty-notice-trade .field__item'
-    )
-    party_served_surname = extract_text(
-        soup, '.field--name-field-penalty-notice-surname .field__item'
-    )
-    party_served = party_served_surname or party_served_trade
-    
-    street = extract_text(
-        soup, '.field--name-field-penalty-notice-street .field__item'
+    fields.update(
+        (key, extract_datetime(wrappers, field_name)) for key, field_name in PENALTY_NOTICE_DATE_FIELDS
     )
     
-    city = extract_text(
-        soup, '.field--name-field-penalty-notice-city .field__item'
-    )
+    trade_name = fields["trade_name"]
+    party_served = fields["party_served_surname"] or trade_name
     
-    postal_code = extract_text(
-        soup, '.field--name-field-penalty-notice-zip .field__item'
-    )
-    if not postal_code:
-        postal_code = city
-    
-    council = extract_text(
-        soup, '.field--name-field-penalty-notice-council .field__item'
-    )
+    street = fields["street"]
+    city = fields["city"]
+    postal_code = fields["postal_code"] or city
     
-    address_parts = []
-    if street:
-        address_parts.append(street)
-    if city:
-        address_parts.append(city)
-    if postal_code:
-        address_parts.append(postal_code)
-    full_address = ", ".join(address_parts) if address_parts else None
-    
-    date_of_offence = extract_datetime(
-        soup, '.field--name-field-penalty-notice-date .field__item time'
-    )
-    date_issued = extract_datetime(
-        soup, '.field--name-field-penalty-notice-issued-date .field__item time'
-    )
-    
-    offence_code = extract_text(
-        soup, '.field--name-field-penalty-notice-code .field__item'
-    )
-    offence_description = extract_text(
-        soup, '.field--name-field-penalty-notice-description .field__item'
-    )
-    offence_nature = extract_text(
-        soup, '.field--name-field-penalty-notice-nature .field__item'
-    )
-    
-    penalty_amount = extract_text(
-        soup, '.field--name-field-penalty-notice-amount .field__item'
-    )
-    
-    issued_by = extract_text(
-        soup, '.field--name-field-penalty-notice-issued-by .field__item'
-    )
+    full_address = ", ".join(part for part in (street, city, postal_code) if part) or None
     
     result = {
         "type": "penalty_notice",
@@ -131,91 +218,78 @@ def parse_penalty_notice_from_html(html_content: str, url: str = "") -> Optional
             "lat": None,
             "lon": None,
         },
-        "council": council,
-        "date_of_offence": date_of_offence,
-        "offence_code": offence_code,
-        "offence_description": offence_description,
-        "offence_nature": offence_nature,
-        "penalty_amount": penalty_amount or "",
+        "council": fields["council"],
+        "date_of_offence": fields["date_of_offence"],
+        "offence_code": fields["offence_code"],
+        "offence_description": fields["offence_description"],
+        "offence_nature": fields["offence_nature"],
+        "penalty_amount": fields["penalty_amount"] or "",
         "party_served": party_served,
-        "date_issued": date_issued,
-        "issued_by": issued_by,
+        "date_issued": fields["date_issued"],
+        "issued_by": fields["issued_by"],
     }
     
     return result
 
 
+def write_json_atomic(path: Path, data) -> None:
+    """Write data as indented JSON via a temp file, so a crash never leaves a truncated file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
 def compare_entries(existing: Dict, new: Dict) -> bool:
     """Compare two penalty notice entries to see if they're the same."""
-    fields_to_compare = [
-        "penalty_notice_number", "name", "council", "date_of_offence",
-        "offence_code", "offence_description", "offence_nature",
-        "penalty_amount", "party_served", "date_issued", "issued_by"
-    ]
-    
-    for field in fields_to_compare:
-        if existing.get(field) != new.get(field):
-            return False
-    
-    for field in ["street", "city", "postal_code", "full"]:
-        if existing.get("address", {}).get(field) != new.get("address", {}).get(field):
-            return False
+    # map(dict.get, ...) keeps missing keys as None, like the old per-field .get()
+    if list(map(existing.get, COMPARE_FIELDS)) != list(map(new.get, COMPARE_FIELDS)):
+        return False
     
-    return True
+    existing_address = existing.get("address", {})
+    new_address = new.get("address", {})
+    return list(map(existing_address.get, COMPARE_ADDRESS_FIELDS)) == list(map(new_address.get, COMPARE_ADDRESS_FIELDS))
 
 
 def download_weekly_notices() -> list:
     """Download the weekly page and extract links to individual penalty notices."""
     print(f"Downloading weekly page: {WEEKLY_URL}")
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(WEEKLY_URL, headers=headers, timeout=30)
+        response = SESSION.get(WEEKLY_URL, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error downloading weekly page: {e}")
         return []
     
-    soup = BeautifulSoup(response.text, 'lxml')
+    tree = parse_html(response.content)
+    if tree is None:
+        print("Error: Weekly page was empty")
+        return []
     
-    # Find all links to penalty notices
-    notice_links = []
+    # Find all links to penalty notices; a dict dedups while keeping page order
+    notice_links = {}
     
-    for link in soup.find_all('a', href=True):
-        href = link.get('href', '')
+    for link in tree.iter('a'):
+        href = link.get('href')
+        if href is None:
+            continue
         # Match penalty notice URLs
-        match = re.search(r'/offences/penalty-notices/(\d+)', href)
-        if match:
-            notice_id = match.group(1)
-            # Convert relative URLs to absolute
-            if href.startswith('/'):
-                full_url = BASE_URL + href
-            elif href.startswith('http'):
-                full_url = href
-            else:
-                full_url = BASE_URL + '/' + href.lstrip('/')
-            
-            if full_url not in notice_links:
-                notice_links.append(full_url)
+        if NOTICE_LINK_RE.search(href):
+            # Convert relative (and protocol-relative) URLs to absolute
+            full_url = urljoin(BASE_URL + '/', href)
+            notice_links.setdefault(full_url, None)
     
     print(f"Found {len(notice_links)} penalty notice links")
-    return notice_links
+    return list(notice_links)
 
 
 def download_and_parse_notice(url: str) -> Optional[Dict]:
     """Download and parse a single penalty notice."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        rate_limiter.acquire()
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
-        time.sleep(RATE_LIMIT_DELAY)  # Rate limiting
-        return parse_penalty_notice_from_html(response.text, url)
+        return parse_penalty_notice_from_html(response.content, url)
     except requests.RequestException as e:
         print(f"Error downloading {url}: {e}")
         return None
@@ -238,8 +312,8 @@ def main():
     existing_notices = {}
     if penalty_notices_file.exists():
         try:
-            with open(penalty_notices_file, 'r', encoding='utf-8') as f:
-                existing_notices = json.load(f)
+            with open(penalty_notices_file, 'rb') as f:
+                existing_notices = orjson.loads(f.read())
             print(f"Loaded {len(existing_notices)} existing penalty notices")
         except Exception as e:
             print(f"Warning: Could not load existing data: {e}")
@@ -268,7 +342,8 @@ def main():
         notice_urls = notice_urls[:args.limit]
         print(f"\nLimited to processing {len(notice_urls)} notices (--limit={args.limit})")
     
-    # Download and parse each notice
+    # Download and parse notices concurrently; the shared rate limiter keeps
+    # the request rate polite while network round trips overlap
     print(f"\nDownloading and parsing {len(notice_urls)} penalty notices...")
     new_notices = {}
     new_notice_ids = []
@@ -276,30 +351,32 @@ def main():
     updated_count = 0
     error_count = 0
     
-    for idx, url in enumerate(notice_urls, 1):
-        print(f"[{idx}/{len(notice_urls)}] Processing: {url}")
-        notice = download_and_parse_notice(url)
-        
-        if not notice:
-            error_count += 1
-            continue
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        notices = executor.map(download_and_parse_notice, notice_urls)
         
-        notice_id = notice["penalty_notice_number"]
-        
-        if notice_id in existing_notices:
-            if compare_entries(existing_notices[notice_id], notice):
-                skipped_count += 1
-                print(f"  Skipped: Already exists with same data")
+        for idx, (url, notice) in enumerate(zip(notice_urls, notices), 1):
+            print(f"[{idx}/{len(notice_urls)}] Processed: {url}")
+            
+            if not notice:
+                error_count += 1
+                continue
+            
+            notice_id = notice["penalty_notice_number"]
+            
+            if notice_id in existing_notices:
+                if compare_entries(existing_notices[notice_id], notice):
+                    skipped_count += 1
+                    print(f"  Skipped: Already exists with same data")
+                else:
+                    print(f"  WARNING: Notice {notice_id} already exists but data differs!")
+                    print(f"  Updating with new data...")
+                    existing_notices[notice_id] = notice
+                    updated_count += 1
             else:
-                print(f"  WARNING: Notice {notice_id} already exists but data differs!")
-                print(f"  Updating with new data...")
                 existing_notices[notice_id] = notice
-                updated_count += 1
-        else:
-            existing_notices[notice_id] = notice
-            new_notices[notice_id] = notice
-            new_notice_ids.append(notice_id)
-            print(f"  Added new notice: {notice_id}")
+                new_notices[notice_id] = notice
+                new_notice_ids.append(notice_id)
+                print(f"  Added new notice: {notice_id}")
     
     print(f"\nDownload summary:")
     print(f"  New notices: {len(new_notices)}")
@@ -313,8 +390,7 @@ def main():
     
     # Save updated penalty notices
     print(f"\nSaving updated penalty notices to {penalty_notices_file}...")
-    with open(penalty_notices_file, 'w', encoding='utf-8') as f:
-        json.dump(existing_notices, f, indent=2, ensure_ascii=False)
+    write_json_atomic(penalty_notices_file, existing_notices)
     
     print("\n" + "="*60)
     print("DOWNLOAD SUMMARY")
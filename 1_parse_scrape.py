@@ -13,16 +13,119 @@ core fields (name, address, dates, penalty_amount, etc) with some extra
 metadata.
 """
 
-import json
+import hashlib
 import os
 import re
 import sys
 import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List
 
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
+from lxml.etree import ParserError, XPath
+from lxml.html import HtmlElement
+
+
+# Files handed to each worker process per batch, to amortise IPC overhead
+PARSE_CHUNKSIZE = 32
+# Size, mtime and content digest of each scraped file as of the last run, to
+# spot re-scraped pages
+PARSE_MANIFEST_FILE = ".parse_manifest.json"
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains `name`."""
+    # The cheap contains(@class, ...) test rejects most elements before the
+    # exact whitespace-delimited class match runs
+    return (
+        f"@class and contains(@class, '{name}') and "
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+    )
+
+
+# Every Drupal field wrapper carries a class like 'field--name-field-penalty-notice-number'.
+# The page is indexed by field name in one pass, and values are then looked up
+# inside the matching wrapper rather than by a full-document XPath per field.
+FIELD_CLASS_PREFIX = "field--name-field-"
+FIELD_WRAPPERS = XPath(f"//*[@class and contains(@class, '{FIELD_CLASS_PREFIX}')]")
+FIELD_ITEM = XPath(f".//*[{has_class('field__item')}]")
+FIELD_ITEM_TIME = XPath(f".//*[{has_class('field__item')}]//time")
+
+# (result key, Drupal field name) pairs
+PENALTY_NOTICE_TEXT_FIELDS = tuple(
+    (key, f"penalty-notice-{name}")
+    for key, name in (
+        ("penalty_notice_number", "number"),
+        ("trade_name", "trade"),
+        ("party_served_surname", "surname"),
+        ("street", "street"),
+        ("city", "city"),
+        ("postal_code", "zip"),
+        ("council", "council"),
+        ("offence_code", "code"),
+        ("offence_description", "description"),
+        ("offence_nature", "nature"),
+        ("penalty_amount", "amount"),
+        ("issued_by", "issued-by"),
+    )
+)
+PENALTY_NOTICE_DATE_FIELDS = (
+    ("date_of_offence", "penalty-notice-date"),
+    ("date_issued", "penalty-notice-issued-date"),
+)
+
+# Drupal field names for the prosecution fields, keyed by field suffix
+PROSECUTION_FIELDS = {
+    name: f"prosecution-notice-{name}"
+    for name in (
+        "trade", "name", "council", "court", "brought", "address", "offence",
+        "nature", "desc", "penalty", "details", "place", "date",
+    )
+}
+SHORTLINK = XPath('//link[@rel="shortlink"]')
+
+# Scraped pages are saved as UTF-8 but not all of them declare a charset, so
+# tell libxml2 rather than letting it fall back to Latin-1 for raw bytes.
+# Element ids are never looked up, so skip building the id table.
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8", collect_ids=False)
+
+# Whitespace clean-up used by extract_html_text
+_RE_TRI_NL = re.compile(r"\n{3,}")
+_RE_HSPACE = re.compile(r"[ \t]+")
+# Any whitespace other than the newline itself around each line break
+_RE_LINE_STRIP = re.compile(r"[^\S\n]*\n[^\S\n]*")
+
+# Full English month names, as matched case-insensitively by strptime's %B
+MONTH_NUMBERS = {
+    name: number
+    for number, name in enumerate(
+        ("january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"),
+        start=1,
+    )
+}
+
+# Patterns used when parsing prosecution pages
+_RE_DATE = re.compile(r"(\d{1,2}\s+[A-Za-z]+\s+\d{4})")
+_RE_NODE_ID = re.compile(r"/node/(\d+)")
+_RE_AMOUNT = re.compile(r"\$?([0-9][0-9,]*(?:\.[0-9]{2})?)")
+_RE_OFFENCE_AMOUNT = re.compile(r"Offence\s+(\d+)[:.]\s*\$?([0-9][0-9,]*(?:\.[0-9]{2})?)", re.IGNORECASE)
+_RE_TOTAL_PENALTY = re.compile(r"Total penalty:\s*\$?([0-9][0-9,]*(?:\.[0-9]{2})?)", re.IGNORECASE)
+_RE_EACH_OFFENCE = re.compile(r"\$?([0-9][0-9,]*(?:\.[0-9]{2})?)\s+for\s+each\s+offence", re.IGNORECASE)
+
+# Fields that decide whether a re-parsed entry differs from the stored one
+COMPARE_FIELDS = (
+    "penalty_notice_number", "name", "council", "date_of_offence",
+    "offence_code", "offence_description", "offence_nature",
+    "penalty_amount", "party_served", "date_issued", "issued_by",
+)
+COMPARE_ADDRESS_FIELDS = ("street", "city", "postal_code", "full")
 
 
 def find_penalty_notice_files(base_dir: str) -> list:
@@ -30,17 +133,21 @@ def find_penalty_notice_files(base_dir: str) -> list:
     base_path = Path(base_dir)
     penalty_dir = base_path / "www.foodauthority.nsw.gov.au" / "offences" / "penalty-notices"
     
-    if not penalty_dir.exists():
+    # Find all files that match the pattern (numeric filenames only).
+    # scandir reuses the file type from the directory listing instead of
+    # stat-ing every entry. Sorted so the output JSON has a stable key order;
+    # the plain path strings sort far faster than Path objects.
+    try:
+        with os.scandir(penalty_dir) as entries:
+            paths = sorted(
+                entry.path for entry in entries
+                if entry.name.isdigit() and entry.is_file()
+            )
+    except FileNotFoundError:
         print(f"Error: Directory {penalty_dir} does not exist")
         return []
     
-    # Find all files that match the pattern (numeric filenames only)
-    files = []
-    for file_path in penalty_dir.iterdir():
-        if file_path.is_file() and re.match(r'^\d+$', file_path.name):
-            files.append(file_path)
-    
-    return sorted(files)
+    return [Path(path) for path in paths]
 
 
 def find_prosecution_files(base_dir: str) -> list:
@@ -48,90 +155,156 @@ def find_prosecution_files(base_dir: str) -> list:
     base_path = Path(base_dir)
     prosecutions_dir = base_path / "www.foodauthority.nsw.gov.au" / "offences" / "prosecutions"
 
-    if not prosecutions_dir.exists():
+    # Prosecution pages are slug-based (e.g. pizza-hut-cambridge-gardens), so just take all files
+    try:
+        with os.scandir(prosecutions_dir) as entries:
+            paths = sorted(entry.path for entry in entries if entry.is_file())
+    except FileNotFoundError:
         print(f"Warning: Directory {prosecutions_dir} does not exist - no prosecutions will be parsed")
         return []
 
-    files = []
-    for file_path in prosecutions_dir.iterdir():
-        # Prosecution pages are slug-based (e.g. pizza-hut-cambridge-gardens), so just take all files
-        if file_path.is_file():
-            files.append(file_path)
+    return [Path(path) for path in paths]
+
+
+def source_key(file_path: Path) -> str:
+    """Manifest key for a scraped file, e.g. 'penalty-notices/3000000000'."""
+    return f"{file_path.parent.name}/{file_path.name}"
+
+
+def file_fingerprint(file_path: Path) -> List[int]:
+    """Size and modification time of a scraped file."""
+    stat = file_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+@lru_cache(maxsize=None)
+def file_digest(file_path: Path) -> str:
+    """Content hash of a scraped file, to tell an identical rewrite from a real change."""
+    return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+
+
+def write_json_atomic(path: Path, data) -> None:
+    """Write data as indented JSON via a temp file, so a crash never leaves a truncated file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
+def parse_html(content: bytes) -> Optional[HtmlElement]:
+    """Parse raw HTML bytes with lxml, returning None for empty documents."""
+    try:
+        return lxml.html.fromstring(content, parser=HTML_PARSER)
+    except ParserError:
+        return None
 
-    return sorted(files)
 
+def select_one(tree: HtmlElement, selector: XPath) -> Optional[HtmlElement]:
+    """Return the first element matching a compiled selector, or None."""
+    elements = selector(tree)
+    return elements[0] if elements else None
 
-def extract_text(soup: BeautifulSoup, selector: str) -> Optional[str]:
-    """Extract text from a CSS selector, returning None if not found."""
-    element = soup.select_one(selector)
-    if element:
-        return element.get_text(strip=True)
+
+def stripped_strings(element: HtmlElement) -> Iterator[str]:
+    """Yield the non-empty, whitespace-stripped text fragments of an element."""
+    for text in element.itertext():
+        text = text.strip()
+        if text:
+            yield text
+
+
+def index_field_wrappers(tree: HtmlElement) -> Dict[str, List[HtmlElement]]:
+    """Map each Drupal field name on the page, e.g. 'penalty-notice-number', to its wrapper elements."""
+    wrappers = {}
+    for wrapper in FIELD_WRAPPERS(tree):
+        for class_name in wrapper.get("class").split():
+            if class_name.startswith(FIELD_CLASS_PREFIX):
+                wrappers.setdefault(class_name[len(FIELD_CLASS_PREFIX):], []).append(wrapper)
+    return wrappers
+
+
+def field_item(
+    wrappers: Dict[str, List[HtmlElement]], field_name: str, selector: XPath = FIELD_ITEM
+) -> Optional[HtmlElement]:
+    """Return the first element matching `selector` inside the named field, or None."""
+    for wrapper in wrappers.get(field_name, ()):
+        elements = selector(wrapper)
+        if elements:
+            return elements[0]
+    return None
+
+
+def extract_text(wrappers: Dict[str, List[HtmlElement]], field_name: str) -> Optional[str]:
+    """Extract the text of a field, returning None if not found."""
+    element = field_item(wrappers, field_name)
+    if element is not None:
+        return "".join(stripped_strings(element))
     return None
 
 
-def extract_datetime(soup: BeautifulSoup, selector: str) -> Optional[str]:
-    """Extract datetime attribute from a time element."""
-    element = soup.select_one(selector)
-    if element and element.name == 'time':
+def extract_datetime(wrappers: Dict[str, List[HtmlElement]], field_name: str) -> Optional[str]:
+    """Extract the datetime attribute of the time element in a field."""
+    element = field_item(wrappers, field_name, FIELD_ITEM_TIME)
+    if element is not None:
         return element.get('datetime')
     return None
 
 
-def extract_html_text(soup: BeautifulSoup, selector: str) -> Optional[str]:
+def extract_html_text(wrappers: Dict[str, List[HtmlElement]], field_name: str) -> Optional[str]:
     """
-    Extract text from a selector, preserving line breaks from <br> tags,
+    Extract the text of a field, preserving line breaks from <br> tags,
     list structure, and paragraph breaks.
     """
-    element = soup.select_one(selector)
-    if not element:
-        return None
-    
-    # Create a copy to avoid modifying the original
-    element_copy = BeautifulSoup(str(element), "lxml")
-    
-    # Replace <br> and <br/> tags with newlines
-    for br in element_copy.find_all("br"):
-        br.replace_with("\n")
-    
-    # Replace <p> tags with newlines before and after
-    for p in element_copy.find_all("p"):
-        p.insert_before("\n")
-        p.insert_after("\n")
-    
-    # Replace <li> tags with newlines and add numbering/bullets
-    # Process each list separately to get correct numbering
-    for list_tag in element_copy.find_all(["ol", "ul"]):
-        list_items = list_tag.find_all("li", recursive=False)  # Only direct children
-        for idx, li in enumerate(list_items, start=1):
-            li.insert_before("\n")
-            if list_tag.name == "ol":
-                # Numbered list items for ordered lists
-                prefix = f"{idx}. "
-            else:
-                # Bullet points for unordered lists
-                prefix = "• "
+    return html_element_text(field_item(wrappers, field_name))
+
+
+def collect_html_text(element: HtmlElement, parts: List[str]) -> None:
+    """
+    Append the text of an element's content to `parts`, with a newline around
+    <p>, <ol> and <ul> blocks, after each <br>, and before each list item,
+    which is prefixed with its number (<ol>) or a bullet (<ul>).
+    """
+    if element.text:
+        parts.append(element.text)
+    
+    item_number = 0
+    for child in element:
+        tag = child.tag
+        # Comments and processing instructions contribute only their tail
+        if isinstance(tag, str):
+            if tag in ("p", "ol", "ul"):
+                parts.append("\n")
+            elif tag == "li" and element.tag in ("ol", "ul"):
+                item_number += 1
+                parts.append("\n")
+                # Numbered list items for ordered lists, bullet points for unordered lists
+                parts.append(f"{item_number}. " if element.tag == "ol" else "• ")
             
-            # Prepend the prefix to the list item content
-            if li.string:
-                li.string = prefix + li.string
-            else:
-                # If the li has nested elements, prepend prefix as text
-                li.insert(0, prefix)
-    
-    # Replace <ol> and <ul> tags with newlines
-    for list_tag in element_copy.find_all(["ol", "ul"]):
-        list_tag.insert_before("\n")
-        list_tag.insert_after("\n")
+            collect_html_text(child, parts)
+            
+            if tag in ("br", "p", "ol", "ul"):
+                parts.append("\n")
+        
+        if child.tail:
+            parts.append(child.tail)
+
+
+def html_element_text(element: Optional[HtmlElement]) -> Optional[str]:
+    """Text of an already-selected element, formatted as in extract_html_text."""
+    if element is None:
+        return None
     
-    # Get the text with preserved newlines
-    text = element_copy.get_text()
+    # Walk the element once, emitting the line breaks and list markers
+    # alongside the text, rather than copying and rewriting the subtree
+    parts = []
+    collect_html_text(element, parts)
+    text = "".join(parts)
     
     # Normalise multiple consecutive newlines to at most two
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _RE_TRI_NL.sub("\n\n", text)
     # Normalise multiple spaces to single space (but preserve newlines)
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _RE_HSPACE.sub(" ", text)
     # Remove spaces at the start/end of lines
-    text = "\n".join(line.strip() for line in text.split("\n"))
+    text = _RE_LINE_STRIP.sub("\n", text)
     # Remove leading/trailing newlines
     text = text.strip()
     
@@ -147,103 +320,59 @@ def parse_date_text(date_str: Optional[str]) -> Optional[str]:
     if not date_str:
         return None
 
-    cleaned = re.sub(r"\s+", " ", date_str).strip()
+    cleaned = " ".join(date_str.split())
     # Some dates might have prefixes like 'On 18 September 2023' – strip leading words
-    match = re.search(r"(\d{1,2}\s+[A-Za-z]+\s+\d{4})", cleaned)
+    match = _RE_DATE.search(cleaned)
     if not match:
         return None
 
-    date_part = match.group(1)
+    day, month_name, year = match.group(1).split()
+    month = MONTH_NUMBERS.get(month_name.lower())
+    if month is None:
+        return None
     try:
-        dt = datetime.strptime(date_part, "%d %B %Y")
-        # Keep the same convention as other dates (12:00:00Z)
-        return dt.strftime("%Y-%m-%dT12:00:00Z")
+        # Constructing the date validates the day for the month (and leap years)
+        dt = datetime(int(year), month, int(day))
     except ValueError:
         return None
+    # Keep the same convention as other dates (12:00:00Z)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T12:00:00Z"
 
 
 def parse_penalty_notice(file_path: Path) -> Optional[Dict]:
     """Parse a single penalty notice HTML file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = file_path.read_bytes()
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None
     
-    soup = BeautifulSoup(content, 'lxml')
+    tree = parse_html(content)
+    if tree is None:
+        print(f"Warning: Could not find penalty notice number in {file_path}")
+        return None
     
-    penalty_notice_number = extract_text(
-        soup, '.field--name-field-penalty-notice-number .field__item'
-    )
+    wrappers = index_field_wrappers(tree)
+    fields = {key: extract_text(wrappers, field_name) for key, field_name in PENALTY_NOTICE_TEXT_FIELDS}
     
+    penalty_notice_number = fields["penalty_notice_number"]
     if not penalty_notice_number:
         print(f"Warning: Could not find penalty notice number in {file_path}")
         return None
     
-    trade_name = extract_text(
-        soup, '.field--name-field-penalty-notice-trade .field__item'
-    )
-    
-    party_served_trade = extract_text(
-        soup, '.field--name-field-penalty-notice-trade .field__item'
-    )
-    party_served_surname = extract_text(
-        soup, '.field--name-field-penalty-notice-surname .field__item'
-    )
-    party_served = party_served_surname or party_served_trade
-    
-    street = extract_text(
-        soup, '.field--name-field-penalty-notice-street .field__item'
-    )
-    
-    city = extract_text(
-        soup, '.field--name-field-penalty-notice-city .field__item'
+    fields.update(
+        (key, extract_datetime(wrappers, field_name)) for key, field_name in PENALTY_NOTICE_DATE_FIELDS
     )
     
-    postal_code = extract_text(
-        soup, '.field--name-field-penalty-notice-zip .field__item'
-    )
-    if not postal_code:
-        postal_code = city
-    
-    council = extract_text(
-        soup, '.field--name-field-penalty-notice-council .field__item'
-    )
-    
-    address_parts = []
-    if street:
-        address_parts.append(street)
-    if city:
-        address_parts.append(city)
-    if postal_code:
-        address_parts.append(postal_code)
-    full_address = ", ".join(address_parts) if address_parts else None
-    
-    date_of_offence = extract_datetime(
-        soup, '.field--name-field-penalty-notice-date .field__item time'
-    )
-    date_issued = extract_datetime(
-        soup, '.field--name-field-penalty-notice-issued-date .field__item time'
-    )
+    trade_name = fields["trade_name"]
+    party_served = fields["party_served_surname"] or trade_name
     
-    offence_code = extract_text(
-        soup, '.field--name-field-penalty-notice-code .field__item'
-    )
-    offence_description = extract_text(
-        soup, '.field--name-field-penalty-notice-description .field__item'
-    )
-    offence_nature = extract_text(
-        soup, '.field--name-field-penalty-notice-nature .field__item'
-    )
+    street = fields["street"]
+    city = fields["city"]
+    postal_code = fields["postal_code"] or city
     
-    penalty_amount = extract_text(
-        soup, '.field--name-field-penalty-notice-amount .field__item'
-    )
+    full_address = ", ".join(part for part in (street, city, postal_code) if part) or None
     
-    issued_by = extract_text(
-        soup, '.field--name-field-penalty-notice-issued-by .field__item'
-    )
     result = {
         "type": "penalty_notice",
         "penalty_notice_number": penalty_notice_number,
@@ -256,48 +385,47 @@ def parse_penalty_notice(file_path: Path) -> Optional[Dict]:
             "lat": None,
             "lon": None,
         },
-        "council": council,
-        "date_of_offence": date_of_offence,
-        "offence_code": offence_code,
-        "offence_description": offence_description,
-        "offence_nature": offence_nature,
-        "penalty_amount": penalty_amount or "",
+        "council": fields["council"],
+        "date_of_offence": fields["date_of_offence"],
+        "offence_code": fields["offence_code"],
+        "offence_description": fields["offence_description"],
+        "offence_nature": fields["offence_nature"],
+        "penalty_amount": fields["penalty_amount"] or "",
         "party_served": party_served,
-        "date_issued": date_issued,
-        "issued_by": issued_by,
+        "date_issued": fields["date_issued"],
+        "issued_by": fields["issued_by"],
     }
     
     return result
 
 
-def extract_list_items(soup: BeautifulSoup, selector: str) -> List[str]:
+def extract_list_items(element: Optional[HtmlElement]) -> List[str]:
     """
-    Extract individual <li> items from a selector that contains a list.
+    Extract individual <li> items from an element that contains a list.
     Returns a list of text content for each <li> item.
     """
-    element = soup.select_one(selector)
-    if not element:
+    if element is None:
         return []
     
     # Find all <ol> or <ul> lists within the element
-    lists = element.find_all(["ol", "ul"], recursive=True)
+    lists = list(element.iterdescendants("ol", "ul"))
     if not lists:
         return []
     
     items = []
     for list_tag in lists:
         # Get all direct <li> children (not nested ones)
-        list_items = list_tag.find_all("li", recursive=False)
+        list_items = list_tag.findall("li")
         for li in list_items:
             # Get text content, preserving structure but cleaning up
-            text = li.get_text(separator=" ", strip=True)
+            text = " ".join(stripped_strings(li))
             if text:
                 items.append(text)
     
     return items
 
 
-def extract_individual_penalties(soup: BeautifulSoup, selector: str) -> List[Optional[str]]:
+def extract_individual_penalties(element: Optional[HtmlElement]) -> List[Optional[str]]:
     """
     Extract individual penalty amounts from the penalty field.
     Returns a list of penalty amounts (one per offence, or None if not found).
@@ -306,32 +434,30 @@ def extract_individual_penalties(soup: BeautifulSoup, selector: str) -> List[Opt
     - "<ol><li>$800</li><li>$800</li></ol>"
     - "$4000 for each offence. Total of $44,000 for eleven (11) offences."
     """
-    element = soup.select_one(selector)
-    if not element:
+    if element is None:
         return []
     
     penalties = []
     
     # First, try to extract from HTML list items
-    lists = element.find_all(["ol", "ul"], recursive=True)
+    lists = list(element.iterdescendants("ol", "ul"))
     if lists:
         for list_tag in lists:
-            list_items = list_tag.find_all("li", recursive=False)
+            list_items = list_tag.findall("li")
             for li in list_items:
-                text = li.get_text(strip=True)
+                text = "".join(stripped_strings(li))
                 # Look for dollar amount in the text
-                amount_match = re.search(r"\$?([0-9][0-9,]*(?:\.[0-9]{2})?)", text)
+                amount_match = _RE_AMOUNT.search(text)
                 if amount_match:
                     penalties.append(f"${amount_match.group(1)}")
         if penalties:
             return penalties
     
     # If no list items, try to parse from text content
-    penalty_text = element.get_text()
+    penalty_text = element.text_content()
     
     # Try to find individual offence penalties in format "Offence N: $X"
-    offence_pattern = re.compile(r"Offence\s+(\d+)[:.]\s*\$?([0-9][0-9,]*(?:\.[0-9]{2})?)", re.IGNORECASE)
-    matches = offence_pattern.findall(penalty_text)
+    matches = _RE_OFFENCE_AMOUNT.findall(penalty_text)
     
     if matches:
         # Sort by offence number and extract amounts
@@ -349,54 +475,58 @@ def parse_prosecution_notice(file_path: Path) -> Optional[List[Dict]]:
     Returns a list of entries, one for each offence (<li> item) in the prosecution.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = file_path.read_bytes()
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None
 
-    soup = BeautifulSoup(content, "lxml")
+    tree = parse_html(content)
+    if tree is None:
+        print(f"Warning: Empty prosecution file {file_path}")
+        return None
 
     prosecution_id: Optional[str] = None
     prosecution_slug = file_path.name
     
-    shortlink = soup.select_one('link[rel="shortlink"]')
-    if shortlink and shortlink.get("href"):
-        node_match = re.search(r"/node/(\d+)", shortlink["href"])
+    shortlink = select_one(tree, SHORTLINK)
+    if shortlink is not None and shortlink.get("href"):
+        node_match = _RE_NODE_ID.search(shortlink.get("href"))
         if node_match:
             prosecution_id = f"prosecution-{node_match.group(1)}"
 
     if not prosecution_id:
         prosecution_id = f"prosecution-{prosecution_slug}"
 
+    wrappers = index_field_wrappers(tree)
+
     trade_name = extract_text(
-        soup, ".field--name-field-prosecution-notice-trade .field__item"
+        wrappers, PROSECUTION_FIELDS["trade"]
     )
     name_of_convicted = extract_text(
-        soup, ".field--name-field-prosecution-notice-name .field__item"
+        wrappers, PROSECUTION_FIELDS["name"]
     )
 
     council = extract_text(
-        soup, ".field--name-field-prosecution-notice-council .field__item"
+        wrappers, PROSECUTION_FIELDS["council"]
     )
     date_of_decision = extract_datetime(
-        soup, ".field--name-field-prosecution-notice-date .field__item time"
+        wrappers, PROSECUTION_FIELDS["date"]
     )
     court = extract_text(
-        soup, ".field--name-field-prosecution-notice-court .field__item"
+        wrappers, PROSECUTION_FIELDS["court"]
     )
     brought_by = extract_text(
-        soup, ".field--name-field-prosecution-notice-brought .field__item"
+        wrappers, PROSECUTION_FIELDS["brought"]
     )
 
-    address_element = soup.select_one(
-        ".field--name-field-prosecution-notice-address .field__item"
+    address_element = field_item(
+        wrappers, PROSECUTION_FIELDS["address"]
     )
     street = None
     city = None
     full_address = None
-    if address_element:
-        lines = [line.strip() for line in address_element.stripped_strings if line.strip()]
+    if address_element is not None:
+        lines = list(stripped_strings(address_element))
         if lines:
             # For prosecution addresses, combine all lines except the last as street
             # The last line is typically city/postcode
@@ -414,73 +544,60 @@ def parse_prosecution_notice(file_path: Path) -> Optional[List[Dict]]:
                 full_address = ", ".join(lines)
 
     date_of_offence_text = extract_html_text(
-        soup, ".field--name-field-prosecution-notice-offence .field__item"
+        wrappers, PROSECUTION_FIELDS["offence"]
     )
     date_of_offence = parse_date_text(date_of_offence_text)
 
-    # Extract individual offence items from the list
-    offence_items = extract_list_items(
-        soup, ".field--name-field-prosecution-notice-nature .field__item"
-    )
+    # Extract individual offence items from the list. The nature and penalty
+    # fields are each read two ways, so select their elements only once.
+    nature_element = field_item(wrappers, PROSECUTION_FIELDS["nature"])
+    offence_items = extract_list_items(nature_element)
     
     # If no list items found, fall back to the full text (single offence case)
     if not offence_items:
-        offence_nature_full = extract_html_text(
-            soup, ".field--name-field-prosecution-notice-nature .field__item"
-        )
+        offence_nature_full = html_element_text(nature_element)
         if offence_nature_full:
             offence_items = [offence_nature_full]
     # If we found list items, we should only use those (not the full text)
     # This prevents creating duplicate entries
 
     decision_text = extract_html_text(
-        soup, ".field--name-field-prosecution-notice-desc .field__item"
+        wrappers, PROSECUTION_FIELDS["desc"]
     )
     base_offence_description = (
         f"Prosecution: {decision_text}" if decision_text else "Prosecution"
     )
 
-    penalty_text = extract_html_text(
-        soup, ".field--name-field-prosecution-notice-penalty .field__item"
-    )
+    penalty_element = field_item(wrappers, PROSECUTION_FIELDS["penalty"])
+    penalty_text = html_element_text(penalty_element)
     
     # Try to extract individual penalties from the raw HTML element
-    individual_penalties = extract_individual_penalties(
-        soup, ".field--name-field-prosecution-notice-penalty .field__item"
-    )
+    individual_penalties = extract_individual_penalties(penalty_element)
     
     # Fallback: extract total penalty
     total_penalty_amount = ""
     if penalty_text:
-        total_match = re.search(
-            r"Total penalty:\s*\$?([0-9][0-9,]*(?:\.[0-9]{2})?)",
-            penalty_text,
-            flags=re.IGNORECASE,
-        )
+        total_match = _RE_TOTAL_PENALTY.search(penalty_text)
         if total_match:
             amount_str = total_match.group(1)
             total_penalty_amount = f"${amount_str}"
         elif not individual_penalties:
             # If no individual penalties found and no total, try to find any dollar amount
-            any_amount_match = re.search(
-                r"\$?([0-9][0-9,]*(?:\.[0-9]{2})?)",
-                penalty_text,
-            )
+            any_amount_match = _RE_AMOUNT.search(penalty_text)
             if any_amount_match:
                 total_penalty_amount = f"${any_amount_match.group(1)}"
 
     decision_details = extract_html_text(
-        soup, ".field--name-field-prosecution-notice-details .field__item"
+        wrappers, PROSECUTION_FIELDS["details"]
     )
     usual_place = extract_html_text(
-        soup, ".field--name-field-prosecution-notice-place .field__item"
+        wrappers, PROSECUTION_FIELDS["place"]
     )
 
     # Check for "for each offence" pattern
     each_offence_amount = None
     if penalty_text:
-        each_pattern = re.compile(r"\$?([0-9][0-9,]*(?:\.[0-9]{2})?)\s+for\s+each\s+offence", re.IGNORECASE)
-        each_match = each_pattern.search(penalty_text)
+        each_match = _RE_EACH_OFFENCE.search(penalty_text)
         if each_match:
             each_offence_amount = f"${each_match.group(1)}"
     
@@ -537,21 +654,13 @@ def parse_prosecution_notice(file_path: Path) -> Optional[List[Dict]]:
 
 def compare_entries(existing: Dict, new: Dict) -> bool:
     """Compare two penalty notice entries to see if they're the same."""
-    fields_to_compare = [
-        "penalty_notice_number", "name", "council", "date_of_offence",
-        "offence_code", "offence_description", "offence_nature",
-        "penalty_amount", "party_served", "date_issued", "issued_by"
-    ]
-    
-    for field in fields_to_compare:
-        if existing.get(field) != new.get(field):
-            return False
+    # map(dict.get, ...) keeps missing keys as None, like the old per-field .get()
+    if list(map(existing.get, COMPARE_FIELDS)) != list(map(new.get, COMPARE_FIELDS)):
+        return False
     
-    for field in ["street", "city", "postal_code", "full"]:
-        if existing.get("address", {}).get(field) != new.get("address", {}).get(field):
-            return False
-    
-    return True
+    existing_address = existing.get("address", {})
+    new_address = new.get("address", {})
+    return list(map(existing_address.get, COMPARE_ADDRESS_FIELDS)) == list(map(new_address.get, COMPARE_ADDRESS_FIELDS))
 
 
 def main():
@@ -559,6 +668,8 @@ def main():
     parser = argparse.ArgumentParser(description='Parse penalty notices and prosecutions from HTML files')
     parser.add_argument('--prosecution', type=str, help='Process only a specific prosecution file (by slug, e.g. "wudu")')
     parser.add_argument('--penalty', type=str, help='Process only a specific penalty notice file (by ID)')
+    parser.add_argument('--force', action='store_true', help='Re-parse files even if they are unchanged since the last run')
+    parser.add_argument('--verbose', action='store_true', help='Print both versions of entries whose data differs')
     args = parser.parse_args()
     
     base_dir = Path(__file__).parent
@@ -567,13 +678,21 @@ def main():
     existing_data = {}
     if output_file.exists():
         try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
+            existing_data = orjson.loads(output_file.read_bytes())
             print(f"Loaded {len(existing_data)} existing penalty notices")
         except Exception as e:
             print(f"Warning: Could not load existing data: {e}")
             existing_data = {}
     
+    manifest_file = base_dir / PARSE_MANIFEST_FILE
+    manifest = {}
+    if manifest_file.exists():
+        try:
+            manifest = orjson.loads(manifest_file.read_bytes())
+        except Exception as e:
+            print(f"Warning: Could not load parse manifest: {e}")
+            manifest = {}
+    
     if args.penalty:
         penalty_files = [base_dir / "www.foodauthority.nsw.gov.au" / "offences" / "penalty-notices" / args.penalty]
         penalty_files = [f for f in penalty_files if f.exists()]
@@ -598,15 +717,18 @@ def main():
     # Remove old combined prosecution entries that have been split
     print("\nChecking for old combined prosecution entries to remove...")
     removed_count = 0
+    # Split entries are keyed "{prosecution_id}-{n}", so count them per base key
+    # once rather than scanning every key for each prosecution
+    split_entries = Counter(key.rsplit("-", 1)[0] for key in existing_data)
     for key in list(existing_data.keys()):
         entry = existing_data[key]
         if entry.get("type") == "prosecution":
             prosecution_id = entry.get("prosecution_notice_id")
             if prosecution_id and prosecution_id == key:
                 # Check if there are split entries for this prosecution
-                split_keys = [k for k in existing_data.keys() if k.startswith(f"{prosecution_id}-") and k != key]
-                if split_keys:
-                    print(f"  Removing old combined entry: {key} (found {len(split_keys)} split entries)")
+                split_count = split_entries[prosecution_id]
+                if split_count:
+                    print(f"  Removing old combined entry: {key} (found {split_count} split entries)")
                     del existing_data[key]
                     removed_count += 1
     if removed_count > 0:
@@ -626,79 +748,153 @@ def main():
     updated_prosecutions = 0
     error_prosecutions = 0
     
-    for file_path in penalty_files:
-        result = parse_penalty_notice(file_path)
+    fingerprints = {
+        file_path: file_fingerprint(file_path)
+        for file_path in penalty_files + prosecution_files
+    }
+    
+    # Skip files that were already parsed on a previous run and have not been
+    # re-scraped since, unless forced or a single file was requested. Penalty
+    # notice files are named by notice number, and prosecution entries record
+    # the slug of their source file.
+    if not (args.force or args.penalty or args.prosecution):
+        entries_per_slug = Counter(
+            entry.get("prosecution_slug") for entry in existing_data.values()
+            if entry.get("type") == "prosecution"
+        )
         
-        if not result:
-            error_penalties += 1
-            continue
+        def unchanged(file_path: Path) -> bool:
+            recorded = manifest.get(source_key(file_path))
+            # Files with no recorded fingerprint predate the manifest, so trust their entries
+            if recorded is None or recorded[:2] == fingerprints[file_path]:
+                return True
+            # A re-scrape that rewrote the file with the same size may not have
+            # changed it, so only re-parse if the content differs
+            if recorded[0] == fingerprints[file_path][0] and len(recorded) > 2:
+                return recorded[2] == file_digest(file_path)
+            return False
+        
+        new_penalty_files = [
+            f for f in penalty_files if f.name not in existing_data or not unchanged(f)
+        ]
+        skipped_penalties += len(penalty_files) - len(new_penalty_files)
+        penalty_files = new_penalty_files
         
-        penalty_number = result["penalty_notice_number"]
+        new_prosecution_files = []
+        for file_path in prosecution_files:
+            if file_path.name in entries_per_slug and unchanged(file_path):
+                skipped_prosecutions += entries_per_slug[file_path.name]
+            else:
+                new_prosecution_files.append(file_path)
+        prosecution_files = new_prosecution_files
+        
+        print(f"Parsing {len(penalty_files)} new or changed penalty notice files and "
+              f"{len(prosecution_files)} new or changed prosecution files (use --force to re-parse all)")
+    
+    # Parsing is CPU-bound and independent per file, so fan it out across
+    # processes; results are merged here so existing_data has a single writer.
+    # Most of the per-file time is XPath evaluation, which holds the GIL, so
+    # threads would not help. Incremental runs often have only a few new files,
+    # and starting the worker processes would cost more than parsing them here.
+    with ExitStack() as stack:
+        if len(penalty_files) + len(prosecution_files) > PARSE_CHUNKSIZE:
+            executor = stack.enter_context(ProcessPoolExecutor())
+            parse_all = partial(executor.map, chunksize=PARSE_CHUNKSIZE)
+        else:
+            parse_all = map
         
-        if penalty_number in existing_data:
-            if compare_entries(existing_data[penalty_number], result):
-                skipped_penalties += 1
+        for result in parse_all(parse_penalty_notice, penalty_files):
+            if not result:
+                error_penalties += 1
                 continue
+            
+            penalty_number = result["penalty_notice_number"]
+            
+            if penalty_number in existing_data:
+                if compare_entries(existing_data[penalty_number], result):
+                    skipped_penalties += 1
+                    continue
+                else:
+                    print(f"WARNING: Penalty notice {penalty_number} already exists but data differs!")
+                    if args.verbose:
+                        print(f"  Existing: {orjson.dumps(existing_data[penalty_number], option=orjson.OPT_INDENT_2).decode()}")
+                        print(f"  New: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
+                    existing_data[penalty_number] = result
+                    updated_penalties += 1
             else:
-                print(f"WARNING: Penalty notice {penalty_number} already exists but data differs!")
-                print(f"  Existing: {json.dumps(existing_data[penalty_number], indent=2)}")
-                print(f"  New: {json.dumps(result, indent=2)}")
                 existing_data[penalty_number] = result
-                updated_penalties += 1
-        else:
-            existing_data[penalty_number] = result
-            processed_penalties += 1
-
-    for file_path in prosecution_files:
-        results = parse_prosecution_notice(file_path)
+                processed_penalties += 1
 
-        if not results:
-            error_prosecutions += 1
-            continue
+        for results in parse_all(parse_prosecution_notice, prosecution_files):
+            if not results:
+                error_prosecutions += 1
+                continue
 
-        # If we have multiple results (split offences), remove the old combined entry
-        if len(results) > 1:
-            base_prosecution_id = results[0]["prosecution_notice_id"]
-            # Remove the old combined entry if it exists
-            if base_prosecution_id in existing_data:
-                old_entry = existing_data[base_prosecution_id]
-                # Only remove if it's not already a split entry (doesn't have -N suffix)
-                if not any(k.startswith(f"{base_prosecution_id}-") for k in existing_data.keys()):
-                    print(f"Removing old combined entry: {base_prosecution_id}")
-                    del existing_data[base_prosecution_id]
-
-        # Process each offence entry separately
-        for result in results:
-            prosecution_key = result["penalty_notice_number"]
-
-            if prosecution_key in existing_data:
-                if compare_entries(existing_data[prosecution_key], result):
-                    skipped_prosecutions += 1
-                    continue
+            # If we have multiple results (split offences), remove the old combined entry
+            if len(results) > 1:
+                base_prosecution_id = results[0]["prosecution_notice_id"]
+                # Remove the old combined entry if it exists
+                if base_prosecution_id in existing_data:
+                    old_entry = existing_data[base_prosecution_id]
+                    # Only remove if it's not already a split entry (doesn't have -N suffix)
+                    if not split_entries[base_prosecution_id]:
+                        print(f"Removing old combined entry: {base_prosecution_id}")
+                        del existing_data[base_prosecution_id]
+                        removed_count += 1
+
+            # Process each offence entry separately
+            for result in results:
+                prosecution_key = result["penalty_notice_number"]
+
+                if prosecution_key in existing_data:
+                    if compare_entries(existing_data[prosecution_key], result):
+                        skipped_prosecutions += 1
+                        continue
+                    else:
+                        print(f"WARNING: Prosecution {prosecution_key} already exists but data differs!")
+                        if args.verbose:
+                            print(f"  Existing: {orjson.dumps(existing_data[prosecution_key], option=orjson.OPT_INDENT_2).decode()}")
+                            print(f"  New: {orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()}")
+                        existing_data[prosecution_key] = result
+                        updated_prosecutions += 1
                 else:
-                    print(f"WARNING: Prosecution {prosecution_key} already exists but data differs!")
-                    print(f"  Existing: {json.dumps(existing_data[prosecution_key], indent=2)}")
-                    print(f"  New: {json.dumps(result, indent=2)}")
                     existing_data[prosecution_key] = result
-                    updated_prosecutions += 1
-            else:
-                existing_data[prosecution_key] = result
-                processed_prosecutions += 1
+                    split_entries[prosecution_key.rsplit("-", 1)[0]] += 1
+                    processed_prosecutions += 1
+    
+    # Rewriting the whole file is the slowest part of an incremental run, so
+    # leave it untouched when nothing was added, updated or removed
+    changed_count = (
+        processed_penalties + updated_penalties
+        + processed_prosecutions + updated_prosecutions + removed_count
+    )
+    if changed_count:
+        print(f"\nSaving results to {output_file}")
+        write_json_atomic(output_file, existing_data)
+    else:
+        print(f"\nNo new, updated or removed entries; {output_file} left unchanged")
     
-    print(f"\nSaving results to {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(existing_data, f, indent=2, ensure_ascii=False)
+    manifest_changed = False
+    for file_path, fingerprint in fingerprints.items():
+        key = source_key(file_path)
+        recorded = manifest.get(key)
+        if recorded is not None and recorded[:2] == fingerprint and len(recorded) > 2:
+            continue
+        manifest[key] = fingerprint + [file_digest(file_path)]
+        manifest_changed = True
+    if manifest_changed:
+        manifest_file.write_bytes(orjson.dumps(manifest))
     
     print(f"\nSummary:")
     print(f"  Penalty notices:")
     print(f"    Processed: {processed_penalties} new entries")
     print(f"    Updated: {updated_penalties} entries (data differed)")
-    print(f"    Skipped: {skipped_penalties} entries (already exists, same data)")
+    print(f"    Skipped: {skipped_penalties} entries (already exists)")
     print(f"    Errors: {error_penalties} files")
     print(f"  Prosecutions:")
     print(f"    Processed: {processed_prosecutions} new entries")
     print(f"    Updated: {updated_prosecutions} entries (data differed)")
-    print(f"    Skipped: {skipped_prosecutions} entries (already exists, same data)")
+    print(f"    Skipped: {skipped_prosecutions} entries (already exists)")
     print(f"    Errors: {error_prosecutions} files")
     print(f"\n  Total: {len(existing_data)} offence records in output file")
 
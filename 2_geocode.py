@@ -10,24 +10,27 @@ This script:
 - Tracks failed geocodings for manual review
 """
 
-import json
+import os
 import re
 import time
 import argparse
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+import orjson
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
 
 RATE_LIMIT_DELAY = 1.2
 USER_AGENT_EMAIL = "231821315+aussiedatagal@users.noreply.github.com"
+WHITESPACE_RE = re.compile(r'\s+')
+ADDRESS_TOKEN_SEPARATOR_RE = re.compile(r'[,\s/\-]+')
 
 
 def normalize_address(address: str) -> str:
     """Normalize address for comparison (lowercase, strip extra spaces)."""
-    return re.sub(r'\s+', ' ', address.strip().upper())
+    return WHITESPACE_RE.sub(' ', address.strip().upper())
 
 
 def generate_address_variants(full_address: str) -> list:
@@ -49,7 +52,7 @@ def generate_address_variants(full_address: str) -> list:
         if char in special_chars:
             remaining = current[i + 1:].strip()
             
-            tokens = re.split(r'[,\s/\-]+', remaining)
+            tokens = ADDRESS_TOKEN_SEPARATOR_RE.split(remaining)
             tokens = [t.strip() for t in tokens if t.strip()]
             
             if len(tokens) >= 4:
@@ -72,6 +75,13 @@ def generate_address_variants(full_address: str) -> list:
     return unique_variants
 
 
+def write_json_atomic(path: Path, data) -> None:
+    """Write data as indented JSON via a temp file, so a crash never leaves a truncated file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
 def geocode_address(geocoder: Nominatim, address: str, max_retries: int = 3) -> Optional[Tuple[float, float]]:
     """Geocode an address with retry logic. Returns (lat, lon) tuple if successful, None otherwise."""
     for attempt in range(max_retries):
@@ -107,12 +117,13 @@ def main():
     failed_file = Path("failed_geocoding.json")
     
     print(f"Loading {data_file}...")
-    with open(data_file, 'r', encoding='utf-8') as f:
-        penalty_notices = json.load(f)
+    all_notices = orjson.loads(data_file.read_bytes())
     
-    print(f"Loaded {len(penalty_notices)} penalty notices")
+    print(f"Loaded {len(all_notices)} penalty notices")
     
-    # Filter to specific entries if requested
+    # Filter to specific entries if requested. The filtered notices are the same
+    # objects as in all_notices, so their coordinates are saved with the rest.
+    penalty_notices = all_notices
     if args.id:
         if args.id in penalty_notices:
             penalty_notices = {args.id: penalty_notices[args.id]}
@@ -133,8 +144,9 @@ def main():
     
     address_cache: Dict[str, Tuple[float, float]] = {}
     
+    # Build the cache from all notices, so filtered runs reuse every known location
     print("Building address cache from existing geocoded locations...")
-    for notice_id, notice in penalty_notices.items():
+    for notice_id, notice in all_notices.items():
         address = notice.get("address", {})
         if address.get("lat") is not None and address.get("lon") is not None:
             full_address = address.get("full", "")
@@ -154,6 +166,9 @@ def main():
     
     failed_geocodings = []
     
+    # Start time of the last Nominatim request, for rate limiting
+    last_request_at = float("-inf")
+    
     print("\nStarting geocoding process...")
     for idx, (notice_id, notice) in enumerate(penalty_notices.items(), 1):
         address = notice.get("address", {})
@@ -187,7 +202,12 @@ def main():
         for variant in variants:
             print(f"[{idx}/{len(penalty_notices)}] Trying: {variant}")
             
-            time.sleep(RATE_LIMIT_DELAY)
+            # Only sleep for the part of the interval not already spent on the
+            # previous request and the work since, and not before the first one
+            wait_time = RATE_LIMIT_DELAY - (time.monotonic() - last_request_at)
+            if wait_time > 0:
+                time.sleep(wait_time)
+            last_request_at = time.monotonic()
             
             result = geocode_address(geocoder, variant)
             
@@ -222,18 +242,12 @@ def main():
         
         if idx % 50 == 0:
             print(f"\nSaving progress... ({idx}/{len(penalty_notices)})")
-            with open(data_file, 'w', encoding='utf-8') as f:
-                json.dump(penalty_notices, f, indent=2, ensure_ascii=False)
-            
-            with open(failed_file, 'w', encoding='utf-8') as f:
-                json.dump(failed_geocodings, f, indent=2, ensure_ascii=False)
+            write_json_atomic(data_file, all_notices)
+            write_json_atomic(failed_file, failed_geocodings)
     
     print("\nSaving final results...")
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(penalty_notices, f, indent=2, ensure_ascii=False)
-    
-    with open(failed_file, 'w', encoding='utf-8') as f:
-        json.dump(failed_geocodings, f, indent=2, ensure_ascii=False)
+    write_json_atomic(data_file, all_notices)
+    write_json_atomic(failed_file, failed_geocodings)
     
     print("\n" + "="*60)
     print("GEOCODING SUMMARY")
@@ -11,19 +11,35 @@ This script:
 - Outputs grouped_locations.json with penalties array for each location
 """
 
-import json
+import math
+import re
 import shutil
 from collections import defaultdict
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+import orjson
+
 
 COORDINATE_EPSILON = 0.0001
 NAME_SIMILARITY_THRESHOLD_EXACT_COORDS = 0.60
 NAME_SIMILARITY_THRESHOLD = 0.85
+STREET_ABBREVIATIONS = {
+    "ST": "STREET",
+    "AVE": "AVENUE",
+    "RD": "ROAD",
+    "DR": "DRIVE",
+    "CT": "COURT",
+    "PL": "PLACE",
+    "CRES": "CRESCENT",
+    "CR": "CRESCENT",
+}
+STREET_ABBREVIATION_RE = re.compile(r'\b(' + '|'.join(STREET_ABBREVIATIONS) + r')\b')
 
 
+@lru_cache(maxsize=None)
 def normalize_name(name: str) -> str:
     """Normalize name for comparison (uppercase, strip whitespace)."""
     return name.strip().upper() if name else ""
@@ -31,21 +47,11 @@ def normalize_name(name: str) -> str:
 
 def normalize_address_for_comparison(address: Dict) -> str:
     """Normalize address for comparison."""
-    import re
-    
     def normalize_street(street: str) -> str:
         if not street:
             return ""
-        street = street.strip().upper()
-        street = re.sub(r'\bST\b', 'STREET', street)
-        street = re.sub(r'\bAVE\b', 'AVENUE', street)
-        street = re.sub(r'\bRD\b', 'ROAD', street)
-        street = re.sub(r'\bDR\b', 'DRIVE', street)
-        street = re.sub(r'\bCT\b', 'COURT', street)
-        street = re.sub(r'\bPL\b', 'PLACE', street)
-        street = re.sub(r'\bCRES\b', 'CRESCENT', street)
-        street = re.sub(r'\bCR\b', 'CRESCENT', street)
-        return street
+        # Expand all abbreviations in one pass; no expansion contains another abbreviation
+        return STREET_ABBREVIATION_RE.sub(lambda m: STREET_ABBREVIATIONS[m.group(1)], street.strip().upper())
     
     parts = []
     if address.get("street"):
@@ -57,6 +63,7 @@ def normalize_address_for_comparison(address: Dict) -> str:
     return ", ".join(parts)
 
 
+@lru_cache(maxsize=None)
 def normalize_party_served(party: str) -> str:
     """Normalize party_served for comparison."""
     if not party:
@@ -67,8 +74,12 @@ def normalize_party_served(party: str) -> str:
     return normalized.strip()
 
 
-def name_similarity(name1: str, name2: str) -> float:
-    """Calculate similarity ratio between two names (0.0 to 1.0)."""
+def name_similarity(name1: str, name2: str, cutoff: float = 0.0) -> float:
+    """
+    Calculate similarity ratio between two names (0.0 to 1.0).
+    Returns 0.0 without the full comparison when a cheap upper bound shows the
+    ratio would be below cutoff.
+    """
     norm1 = normalize_name(name1)
     norm2 = normalize_name(name2)
     if not norm1 or not norm2:
@@ -80,7 +91,10 @@ def name_similarity(name1: str, name2: str) -> float:
         if longer > 0:
             return max(0.70, shorter / longer)
     
-    return SequenceMatcher(None, norm1, norm2).ratio()
+    matcher = SequenceMatcher(None, norm1, norm2)
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+    return matcher.ratio()
 
 
 def coordinates_match(lat1: float, lon1: float, lat2: float, lon2: float) -> bool:
@@ -88,9 +102,23 @@ def coordinates_match(lat1: float, lon1: float, lat2: float, lon2: float) -> boo
     return abs(lat1 - lat2) < COORDINATE_EPSILON and abs(lon1 - lon2) < COORDINATE_EPSILON
 
 
+def coordinate_cell(lat: float, lon: float) -> Tuple[int, int]:
+    """
+    Grid cell of a coordinate, in cells COORDINATE_EPSILON wide, so that any
+    coordinates that match are in the same or adjacent cells.
+    """
+    return math.floor(lat / COORDINATE_EPSILON), math.floor(lon / COORDINATE_EPSILON)
+
+
 def create_penalty_dict(notice: Dict) -> Dict:
-    """Create a copy of the full penalty notice data."""
-    return json.loads(json.dumps(notice))
+    """
+    Create a copy of the full penalty notice data. Penalties are never modified
+    once grouped, so a shallow copy (plus the address) is enough.
+    """
+    penalty = dict(notice)
+    if isinstance(penalty.get("address"), dict):
+        penalty["address"] = dict(penalty["address"])
+    return penalty
 
 
 def penalty_exists_in_group(group: Dict, penalty_notice_number: str) -> bool:
@@ -108,8 +136,7 @@ def main():
     
     # Load penalty notices
     print(f"Loading {data_file}...")
-    with open(data_file, 'r', encoding='utf-8') as f:
-        penalty_notices = json.load(f)
+    penalty_notices = orjson.loads(data_file.read_bytes())
     
     print(f"Loaded {len(penalty_notices)} penalty notices")
     
@@ -117,8 +144,7 @@ def main():
     existing_groups: List[Dict] = []
     if output_file.exists():
         try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_groups = json.load(f)
+            existing_groups = orjson.loads(output_file.read_bytes())
             print(f"Loaded {len(existing_groups)} existing location groups")
         except Exception as e:
             print(f"Warning: Could not load existing grouped locations: {e}")
@@ -162,6 +188,12 @@ def main():
     # Start with existing groups
     groups = existing_groups.copy()
     
+    # Index groups by grid cell, so each notice is only compared against groups
+    # near enough for their coordinates to match
+    groups_by_cell: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for group_index, group in enumerate(groups):
+        groups_by_cell[coordinate_cell(group["address"]["lat"], group["address"]["lon"])].append(group_index)
+    
     for notice in notices_to_process:
         address = notice.get("address", {})
         lat = address.get("lat")
@@ -169,10 +201,20 @@ def main():
         name = notice.get("name", "")
         council = notice.get("council", "")
         party_served = notice.get("party_served", "")
+        norm_party = normalize_party_served(party_served)
         
         matched_group = None
         
-        for group in groups:
+        # Nearby groups, in the same order as in the full list
+        cell_lat, cell_lon = coordinate_cell(lat, lon)
+        nearby_group_indexes = sorted(
+            group_index
+            for cell in [(cell_lat + d_lat, cell_lon + d_lon) for d_lat in (-1, 0, 1) for d_lon in (-1, 0, 1)]
+            for group_index in groups_by_cell.get(cell, [])
+        )
+        
+        for group_index in nearby_group_indexes:
+            group = groups[group_index]
             group_lat = group["address"]["lat"]
             group_lon = group["address"]["lon"]
             group_name = group["name"]
@@ -182,26 +224,21 @@ def main():
             coords_match = coordinates_match(lat, lon, group_lat, group_lon)
             
             if coords_match:
+                norm_group_party = normalize_party_served(group_party_served)
                 party_match = False
-                if party_served and group_party_served:
-                    norm_party1 = normalize_party_served(party_served)
-                    norm_party2 = normalize_party_served(group_party_served)
-                    if norm_party1 and norm_party2 and norm_party1 == norm_party2:
-                        party_match = True
+                if norm_party and norm_group_party and norm_party == norm_group_party:
+                    party_match = True
                 
                 if party_match:
                     matched_group = group
                     break
                 
-                similarity = name_similarity(name, group_name)
                 threshold = NAME_SIMILARITY_THRESHOLD_EXACT_COORDS if coords_match else NAME_SIMILARITY_THRESHOLD
+                similarity = name_similarity(name, group_name, threshold)
                 
                 party_mismatch = False
-                if party_served and group_party_served:
-                    norm_party1 = normalize_party_served(party_served)
-                    norm_party2 = normalize_party_served(group_party_served)
-                    if norm_party1 and norm_party2 and norm_party1 != norm_party2:
-                        party_mismatch = True
+                if norm_party and norm_group_party and norm_party != norm_group_party:
+                    party_mismatch = True
                 
                 if similarity >= threshold and not party_mismatch:
                     matched_group = group
@@ -239,6 +276,7 @@ def main():
                 "party_served": party_served,
                 "penalties": [penalty],
             }
+            groups_by_cell[coordinate_cell(lat, lon)].append(len(groups))
             groups.append(new_group)
             print(f"  Created new location: {name}")
     
@@ -251,8 +289,7 @@ def main():
         )
     
     print(f"\nSaving {len(groups)} grouped locations to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(groups, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(orjson.dumps(groups, option=orjson.OPT_INDENT_2))
     
     frontend_file = Path("frontend/public/grouped_locations.json")
     if frontend_file.parent.exists():
@@ -3,19 +3,27 @@
 Verify the pipeline results for duplicates, missing penalties, etc.
 """
 
-import json
+import math
 from pathlib import Path
 from collections import defaultdict
 from difflib import SequenceMatcher
+from functools import lru_cache
 
+import orjson
 
+
+@lru_cache(maxsize=None)
 def normalize_name(name: str) -> str:
     """Normalize name for comparison."""
     return name.strip().upper() if name else ""
 
 
-def name_similarity(name1: str, name2: str) -> float:
-    """Calculate similarity ratio between two names."""
+def name_similarity(name1: str, name2: str, cutoff: float = 0.0) -> float:
+    """
+    Calculate similarity ratio between two names.
+    Returns 0.0 without the full comparison when a cheap upper bound shows the
+    ratio would be below cutoff.
+    """
     norm1 = normalize_name(name1)
     norm2 = normalize_name(name2)
     if not norm1 or not norm2:
@@ -27,7 +35,10 @@ def name_similarity(name1: str, name2: str) -> float:
         if longer > 0:
             return max(0.70, shorter / longer)
     
-    return SequenceMatcher(None, norm1, norm2).ratio()
+    matcher = SequenceMatcher(None, norm1, norm2)
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+    return matcher.ratio()
 
 
 def coordinates_match(lat1: float, lon1: float, lat2: float, lon2: float, epsilon: float = 0.0001) -> bool:
@@ -35,6 +46,11 @@ def coordinates_match(lat1: float, lon1: float, lat2: float, lon2: float, epsilo
     return abs(lat1 - lat2) < epsilon and abs(lon1 - lon2) < epsilon
 
 
+def coordinate_cell(lat: float, lon: float, epsilon: float = 0.0001) -> tuple:
+    """Grid cell of a coordinate; coordinates that match are in the same or adjacent cells."""
+    return math.floor(lat / epsilon), math.floor(lon / epsilon)
+
+
 def main():
     """Verify pipeline results."""
     base_dir = Path(__file__).parent
@@ -47,11 +63,8 @@ def main():
     
     # Load data
     print("\nLoading data...")
-    with open(penalty_notices_file, 'r', encoding='utf-8') as f:
-        penalty_notices = json.load(f)
-    
-    with open(grouped_locations_file, 'r', encoding='utf-8') as f:
-        grouped_locations = json.load(f)
+    penalty_notices = orjson.loads(penalty_notices_file.read_bytes())
+    grouped_locations = orjson.loads(grouped_locations_file.read_bytes())
     
     print(f"Loaded {len(penalty_notices)} penalty notices")
     print(f"Loaded {len(grouped_locations)} location groups")
@@ -67,13 +80,15 @@ def main():
         if address.get("lat") is not None and address.get("lon") is not None:
             geocoded_notices[notice_id] = notice
     
-    # Collect all penalty notice numbers from groups
-    penalties_in_groups = set()
-    for group in grouped_locations:
+    # Collect all penalty notice numbers from groups, with the groups each one
+    # appears in (also used by CHECK 5)
+    penalty_numbers_seen = defaultdict(list)
+    for group_idx, group in enumerate(grouped_locations):
         for penalty in group.get("penalties", []):
             penalty_num = penalty.get("penalty_notice_number")
             if penalty_num:
-                penalties_in_groups.add(penalty_num)
+                penalty_numbers_seen[penalty_num].append((group_idx, group.get("name")))
+    penalties_in_groups = penalty_numbers_seen.keys()
     
     missing_penalties = []
     for notice_id, notice in geocoded_notices.items():
@@ -126,6 +141,16 @@ def main():
     print("CHECK 3: Similar Names at Same Coordinates")
     print("="*60)
     
+    # Index groups by grid cell, so each group is only compared against groups
+    # near enough for their coordinates to match
+    groups_by_cell = defaultdict(list)
+    for idx, group in enumerate(grouped_locations):
+        address = group.get("address", {})
+        lat = address.get("lat")
+        lon = address.get("lon")
+        if lat is not None and lon is not None:
+            groups_by_cell[coordinate_cell(lat, lon)].append(idx)
+    
     similar_names_same_coords = []
     for i, group1 in enumerate(grouped_locations):
         addr1 = group1.get("address", {})
@@ -136,7 +161,17 @@ def main():
         if lat1 is None or lon1 is None:
             continue
         
-        for j, group2 in enumerate(grouped_locations[i+1:], start=i+1):
+        # Later groups in this and the adjacent cells, in list order
+        cell_lat, cell_lon = coordinate_cell(lat1, lon1)
+        nearby_indexes = sorted(
+            j
+            for cell in [(cell_lat + d_lat, cell_lon + d_lon) for d_lat in (-1, 0, 1) for d_lon in (-1, 0, 1)]
+            for j in groups_by_cell.get(cell, [])
+            if j > i
+        )
+        
+        for j in nearby_indexes:
+            group2 = grouped_locations[j]
             addr2 = group2.get("address", {})
             lat2 = addr2.get("lat")
             lon2 = addr2.get("lon")
@@ -146,7 +181,7 @@ def main():
                 continue
             
             if coordinates_match(lat1, lon1, lat2, lon2):
-                similarity = name_similarity(name1, name2)
+                similarity = name_similarity(name1, name2, 0.5)
                 if similarity > 0.5:  # More than 50% similar
                     similar_names_same_coords.append({
                         "coord": (lat1, lon1),
@@ -184,13 +219,6 @@ def main():
     print("CHECK 5: Duplicate Penalty Notice Numbers")
     print("="*60)
     
-    penalty_numbers_seen = defaultdict(list)
-    for group_idx, group in enumerate(grouped_locations):
-        for penalty in group.get("penalties", []):
-            penalty_num = penalty.get("penalty_notice_number")
-            if penalty_num:
-                penalty_numbers_seen[penalty_num].append((group_idx, group.get("name")))
-    
     duplicates = {k: v for k, v in penalty_numbers_seen.items() if len(v) > 1}
     
     if duplicates: